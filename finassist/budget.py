@@ -37,43 +37,59 @@ def budget_summary(rep: pd.DataFrame, topn=5, month_label="(month)"):
     
     return "\n".join(output)
 
+BUDGET_COLUMNS = ["Category", "Budget", "Actual", "Variance"]
+
+# Simple budget defaults (you can load Budget.csv later)
+BUDGET_DEFAULTS = {
+    'Restaurants': 200, 'Coffee': 50, 'Internet': 75, 
+    'Groceries': 300, 'Gas': 100, 'Shopping': 250
+}
+
+def _variance_report(actual_spending: pd.DataFrame) -> pd.DataFrame:
+    """Compare per-category actual spending against the budget defaults."""
+    # Create budget data for categories found in transactions
+    categories = actual_spending['Category'].unique()
+    budget_data = pd.DataFrame([
+        {'Category': cat, 'Budget': BUDGET_DEFAULTS.get(cat, 100)} 
+        for cat in categories
+    ], columns=['Category', 'Budget'])
+    
+    # Merge and calculate variance
+    report = pd.merge(budget_data, actual_spending, on='Category', how='outer')
+    report['Budget'] = report['Budget'].fillna(100)
+    report['Actual'] = report['Actual'].fillna(0)
+    report['Variance'] = report['Actual'] - report['Budget']
+    
+    return report[report['Actual'] > 0]  # Only show categories with spending
+
 def month_report(month: str) -> pd.DataFrame:
     """Analyze actual transaction data for the given month."""
+    return month_reports([month])[month]
+
+def month_reports(months) -> dict:
+    """Analyze several months at once with a single aggregation pass over the transactions."""
+    months = list(dict.fromkeys(months))
     try:
         from .data import tx
         
-        # Filter transactions for the specified month
-        month_data = tx[tx['Month'] == month] if not tx.empty else pd.DataFrame()
-        
-        if month_data.empty:
-            print(f"No transaction data found for {month}")
-            return pd.DataFrame(columns=["Category", "Budget", "Actual", "Variance"])
-        
-        # Group by category and sum spending (use 'Spend' column from your data.py)
-        actual_spending = month_data.groupby('Category')['Spend'].sum().reset_index()
-        actual_spending.columns = ['Category', 'Actual']
-        
-        # Simple budget defaults (you can load Budget.csv later)
-        budget_defaults = {
-            'Restaurants': 200, 'Coffee': 50, 'Internet': 75, 
-            'Groceries': 300, 'Gas': 100, 'Shopping': 250
-        }
-        
-        # Create budget data for categories found in transactions
-        categories = actual_spending['Category'].unique()
-        budget_data = pd.DataFrame([
-            {'Category': cat, 'Budget': budget_defaults.get(cat, 100)} 
-            for cat in categories
-        ])
-        
-        # Merge and calculate variance
-        report = pd.merge(budget_data, actual_spending, on='Category', how='outer')
-        report['Budget'] = report['Budget'].fillna(100)
-        report['Actual'] = report['Actual'].fillna(0)
-        report['Variance'] = report['Actual'] - report['Budget']
+        if tx.empty:
+            spending = pd.DataFrame(columns=['Month', 'Category', 'Actual'])
+        else:
+            month_data = tx[tx['Month'].isin(months)]
+            spending = month_data.groupby(['Month', 'Category'])['Spend'].sum().reset_index()
+            spending.columns = ['Month', 'Category', 'Actual']
+        by_month = dict(tuple(spending.groupby('Month')))
         
-        return report[report['Actual'] > 0]  # Only show categories with spending
+        reports = {}
+        for month in months:
+            if month not in by_month:
+                print(f"No transaction data found for {month}")
+                reports[month] = pd.DataFrame(columns=BUDGET_COLUMNS)
+                continue
+            actual_spending = by_month[month][['Category', 'Actual']].reset_index(drop=True)
+            reports[month] = _variance_report(actual_spending)
+        return reports
         
     except Exception as e:
         print(f"Error in budget analysis: {e}")
-        return pd.DataFrame(columns=["Category", "Budget", "Actual", "Variance"])
\ No newline at end of file
+        return {month: pd.DataFrame(columns=BUDGET_COLUMNS) for month in months}
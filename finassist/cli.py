@@ -1,11 +1,41 @@
-import os, re
+import os, re, sys, json, argparse, multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 import matplotlib.pyplot as plt
-from finassist.rag import rag_answer
-from .budget import parse_month, month_report, budget_summary, human_month
-from .stocks import parse_tickers, parse_period, stock_summary, summarize_returns
+from finassist.rag import rag_answer, encode_queries, answer_batch
+from .budget import parse_month, month_report, month_reports, budget_summary, human_month
+from .stocks import parse_tickers, parse_period, stock_summary, summarize_returns, select_tickers
 from .advice import looks_like_advice, looks_like_budget, looks_like_invest
 from .data import tx
 
+HELP_TEXT = "Try:\n • Where am I over budget in 2019-09?\n • Compare AAPL and MSFT over 1y\n • How can I reduce restaurant spending?"
+
+def route(q: str):
+    """Classify a question as "budget", "invest", "advice" or None (same order as ask())."""
+    ql = q.lower()
+    # Budget first (most specific), then Investment, then Advice/RAG (most general)
+    if looks_like_budget(ql):
+        return "budget"
+    if looks_like_invest(ql):
+        return "invest"
+    if looks_like_advice(ql):
+        return "advice"
+    return None
+
+def _default_month():
+    """Latest month with any spending."""
+    return tx.groupby("Month")["Spend"].sum().pipe(lambda s: s[s>0]).index.max()
+
+def _budget_args(q: str, default_month=None):
+    ql = q.lower()
+    month = parse_month(q) or (default_month if default_month is not None else _default_month())
+    m = re.search(r"top\s+(\d+)", ql); topn = int(m.group(1)) if m else 5
+    return month, topn
+
+def _invest_args(q: str):
+    tickers = parse_tickers(q) or ["SPY"]
+    period = parse_period(q or "6mo")
+    return tickers, period
+
 def ask(q: str):
     ql = q.lower()
     
@@ -15,25 +45,216 @@ def ask(q: str):
     print(f"DEBUG CLI: looks_like_budget={looks_like_budget(ql)}")
     print(f"DEBUG CLI: looks_like_invest={looks_like_invest(ql)}")
     
-    # Check Budget FIRST (most specific)
-    if looks_like_budget(ql):
+    kind = route(q)
+    
+    if kind == "budget":
         print("DEBUG CLI: Going to Budget")
-        month = parse_month(q) or (tx.groupby("Month")["Spend"].sum().pipe(lambda s: s[s>0]).index.max())
+        month, topn = _budget_args(q)
         rep = month_report(month)
-        m = re.search(r"top\s+(\d+)", ql); topn = int(m.group(1)) if m else 5
         return budget_summary(rep, topn=topn, month_label=human_month(month))
     
-    # Check Investment (specific)
-    if looks_like_invest(ql):
+    if kind == "invest":
         print("DEBUG CLI: Going to Investment")
-        tickers = parse_tickers(q) or ["SPY"]
-        period = parse_period(q or "6mo")
+        tickers, period = _invest_args(q)
         results = stock_summary(tickers, period)
         return summarize_returns(results, period)
     
-    # Check Advice/RAG LAST (most general)
-    if looks_like_advice(ql):
+    if kind == "advice":
         print("DEBUG CLI: Going to RAG")
         return rag_answer(q, k=3)
     
-    return "Try:\n • Where am I over budget in 2019-09?\n • Compare AAPL and MSFT over 1y\n • How can I reduce restaurant spending?"
\ No newline at end of file
+    return HELP_TEXT
+
+# Bulk question-file mode
+
+# RAG questions are ranked and answered in slices of this size, one task per slice
+ADVICE_CHUNK_SIZE = 16
+
+def _run_inline(fn, *args, **kwargs) -> Future:
+    """Call fn now and wrap its result (or exception) in a finished Future."""
+    fut = Future()
+    try:
+        fut.set_result(fn(*args, **kwargs))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+def _one_answer(fn, *args, **kwargs):
+    return [fn(*args, **kwargs)]
+
+def _start_pool(processes: int):
+    """
+    Create the process pool and start all of its workers right away.
+    This must run before any handler thread exists (or the model is loaded), so the
+    workers are forked from a single-threaded parent; "fork" also keeps them from
+    re-importing finassist (and re-reading the CSV) where forkserver is the default.
+    """
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context(method))
+    wait([pool.submit(os.getpid) for _ in range(processes)])
+    return pool
+
+def _batch_budget(items, pool):
+    """One aggregation pass for every month asked about, then one summary per question."""
+    default_month = _default_month()
+    args = [_budget_args(q, default_month) for _, q in items]
+    reports = month_reports([month for month, _ in args])
+    return [
+        ([i], _run_inline(_one_answer, budget_summary, reports[month], topn=topn, month_label=human_month(month)))
+        for (i, _), (month, topn) in zip(items, args)
+    ]
+
+def _batch_invest(items, pool):
+    """Fetch each (ticker, period) pair once, shared by every question that needs it."""
+    args = [_invest_args(q) for _, q in items]
+    wanted = {}
+    for tickers, period in args:
+        wanted.setdefault(period, {}).update(dict.fromkeys(tickers))
+    fetched = {period: stock_summary(list(tickers), period) for period, tickers in wanted.items()}
+    return [
+        ([i], _run_inline(_one_answer, summarize_returns, select_tickers(fetched[period], tickers), period))
+        for (i, _), (tickers, period) in zip(items, args)
+    ]
+
+def _batch_advice(items, pool):
+    """Encode every RAG question in one batch, then rank and answer them in slices (on the pool if any)."""
+    questions = [q for _, q in items]
+    chunks, emb, qvs = encode_queries(questions)
+    out = []
+    for start in range(0, len(items), ADVICE_CHUNK_SIZE):
+        stop = start + ADVICE_CHUNK_SIZE
+        indices = [i for i, _ in items[start:stop]]
+        if pool is not None:
+            fut = pool.submit(answer_batch, questions[start:stop], qvs[start:stop], chunks, emb, k=3)
+        else:
+            fut = _run_inline(answer_batch, questions[start:stop], qvs[start:stop], chunks, emb, k=3)
+        out.append((indices, fut))
+    return out
+
+BATCH_HANDLERS = {
+    "budget": _batch_budget,
+    "invest": _batch_invest,
+    "advice": _batch_advice,
+}
+
+def ask_batch(questions, processes: int = 0):
+    """
+    Answer many questions, grouped by route so each group shares its expensive step.
+    Yields (index, route, answer, error) tuples in completion order.
+    
+    Args:
+        questions: List of question strings
+        processes: Size of the process pool used to rank and answer RAG questions (0 = run inline)
+    """
+    groups = {}
+    for i, q in enumerate(questions):
+        groups.setdefault(route(q), []).append((i, q))
+    
+    for i, _ in groups.pop(None, []):
+        yield i, None, HELP_TEXT, None
+    
+    # Start the pool before any handler thread exists (see _start_pool)
+    pool = _start_pool(processes) if processes > 0 and "advice" in groups else None
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as threads:
+            pending = {}
+            for kind, items in groups.items():
+                fut = threads.submit(BATCH_HANDLERS[kind], items, pool)
+                pending[fut] = (kind, items)
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    kind, payload = pending.pop(fut)
+                    if kind == "answer":
+                        # A slice of answers finished
+                        indices, group_kind = payload
+                        err = fut.exception()
+                        answers = [None] * len(indices) if err else fut.result()
+                        for i, answer in zip(indices, answers):
+                            yield i, group_kind, answer, str(err) if err else None
+                        continue
+                    err = fut.exception()
+                    if err:
+                        for i, _ in payload:
+                            yield i, kind, None, str(err)
+                        continue
+                    for indices, answer_fut in fut.result():
+                        pending[answer_fut] = ("answer", (indices, kind))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+def _read_questions(path: str):
+    """
+    Read a JSONL file of {"id": ..., "question": ...} objects (or bare JSON strings).
+    Returns (records, errors): bad lines are skipped and reported as error records with their lineno.
+    """
+    records, errors = [], []
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError as e:
+                errors.append({"id": lineno, "lineno": lineno, "error": f"invalid JSON: {e}"})
+                continue
+            if isinstance(rec, str):
+                rec = {"question": rec}
+            if not isinstance(rec, dict):
+                errors.append({"id": lineno, "lineno": lineno,
+                               "error": f"expected an object or string, got {type(rec).__name__}"})
+                continue
+            question = rec.get("question")
+            if not isinstance(question, str):
+                errors.append({"id": rec.get("id", lineno), "lineno": lineno,
+                               "error": '"question" must be a string'})
+                continue
+            records.append({"id": rec.get("id", lineno), "lineno": lineno, "question": question})
+    return records, errors
+
+def run_batch(in_path: str, out_path: str, processes: int = 0) -> int:
+    """Answer every question in in_path, streaming one JSON result per line to out_path."""
+    records, errors = _read_questions(in_path)
+    questions = [r["question"] for r in records]
+    with open(out_path, "w", encoding="utf-8") as out:
+        for err in errors:
+            print(f"Skipping {in_path}:{err['lineno']}: {err['error']}", file=sys.stderr)
+            rec = {"id": err["id"], "lineno": err["lineno"], "question": None, "route": None,
+                   "answer": None, "error": err["error"]}
+            out.write(json.dumps(rec) + "\n")
+        out.flush()
+        for i, kind, answer, error in ask_batch(questions, processes=processes):
+            rec = {"id": records[i]["id"], "lineno": records[i]["lineno"], "question": questions[i],
+                   "route": kind, "answer": answer}
+            if error:
+                rec["error"] = error
+            out.write(json.dumps(rec) + "\n")
+            out.flush()
+    return len(questions)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FinAssist command line")
+    parser.add_argument("question", nargs="?", help="Single question to answer")
+    parser.add_argument("--questions", help="JSONL file of questions to answer in bulk")
+    parser.add_argument("--out", help="JSONL file to stream bulk answers to")
+    parser.add_argument("--processes", type=int, default=0, help="Process pool size for ranking/answering RAG questions in bulk mode (default: inline)")
+    args = parser.parse_args(argv)
+    
+    if args.processes < 0:
+        parser.error("--processes must be 0 or greater")
+    
+    if args.questions:
+        if not args.out:
+            parser.error("--out is required with --questions")
+        n = run_batch(args.questions, args.out, processes=args.processes)
+        print(f"Answered {n} questions -> {args.out}", file=sys.stderr)
+    elif args.question:
+        print(ask(args.question))
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -85,16 +85,7 @@ def _ensure_index():
     return chunks, emb
 
 # Search
-def _search(query: str, k=3) -> List[Tuple[str, float]]:
-    print(f"DEBUG: Searching for: '{query}'")
-    chunks, emb = _ensure_index()
-    
-    if len(chunks) == 0:
-        print("ERROR: No chunks available for search!")
-        return []
-    
-    model = SentenceTransformer(MODEL_NAME)
-    qv = model.encode([query], normalize_embeddings=True, show_progress_bar=False)[0]
+def _rank(query: str, qv, chunks: List[str], emb, k=3) -> List[Tuple[str, float]]:
     sims = emb @ qv
     idx = np.argsort(-sims)[:k*3]
     
@@ -115,6 +106,26 @@ def _search(query: str, k=3) -> List[Tuple[str, float]]:
     print(f"DEBUG: Found {len(key_hits)} relevant chunks")
     return key_hits[:k]
 
+def _search(query: str, k=3) -> List[Tuple[str, float]]:
+    print(f"DEBUG: Searching for: '{query}'")
+    chunks, emb = _ensure_index()
+    
+    if len(chunks) == 0:
+        print("ERROR: No chunks available for search!")
+        return []
+    
+    model = SentenceTransformer(MODEL_NAME)
+    qv = model.encode([query], normalize_embeddings=True, show_progress_bar=False)[0]
+    return _rank(query, qv, chunks, emb, k=k)
+
+def encode_queries(queries: List[str]):
+    """Load the index once and encode many queries in one batch; returns (chunks, emb, qvs)."""
+    print(f"DEBUG: Batch encoding {len(queries)} queries")
+    chunks, emb = _ensure_index()
+    model = SentenceTransformer(MODEL_NAME)
+    qvs = model.encode(list(queries), normalize_embeddings=True, show_progress_bar=False)
+    return chunks, emb, qvs
+
 # Answer construction
 def _extract_bullets(context: str):
     """Extract bullet points from context."""
@@ -285,22 +296,11 @@ def _make_answer(question: str, context: str, k_keep=5):
     print(f"DEBUG: Final formatted result:\n{final_result}")
     return final_result
 
-def rag_answer(question: str, k: int = 3) -> str:
+def answer_from_results(question: str, search_results: List[Tuple[str, float]]) -> str:
     """
-    Main RAG function that takes a question and returns an answer.
-    This is the function that should be imported by other modules.
-    
-    Args:
-        question: The user's question
-        k: Number of chunks to retrieve (default: 3)
+    Build the final answer for a question from its (chunk, score) search results.
+    Shared by rag_answer() and answer_batch().
     """
-    # Add debug for 50/30/20 questions
-    if "50/30/20" in question or "rule" in question.lower():
-        print(f"DEBUG RAG_ANSWER: Processing question '{question}'")
-    
-    # Search for relevant context
-    search_results = _search(question, k=k)
-    
     if not search_results:
         return f"**Answer:** {question.strip()}\nI couldn't find relevant information in the knowledge base. Please check if your finance guide is properly loaded.\n\n_Source: FinAssist KB_"
     
@@ -325,6 +325,33 @@ def rag_answer(question: str, k: int = 3) -> str:
     
     return answer
 
+def rag_answer(question: str, k: int = 3) -> str:
+    """
+    Main RAG function that takes a question and returns an answer.
+    This is the function that should be imported by other modules.
+    
+    Args:
+        question: The user's question
+        k: Number of chunks to retrieve (default: 3)
+    """
+    # Add debug for 50/30/20 questions
+    if "50/30/20" in question or "rule" in question.lower():
+        print(f"DEBUG RAG_ANSWER: Processing question '{question}'")
+    
+    # Search for relevant context
+    search_results = _search(question, k=k)
+    return answer_from_results(question, search_results)
+
+def answer_batch(questions: List[str], qvs, chunks: List[str], emb, k: int = 3) -> List[str]:
+    """
+    Rank and answer a slice of questions using the index and vectors from encode_queries().
+    Never touches the model or the cached index, so it can run in a worker process.
+    """
+    if len(chunks) == 0:
+        print("ERROR: No chunks available for search!")
+        return [answer_from_results(q, []) for q in questions]
+    return [answer_from_results(q, _rank(q, qv, chunks, emb, k=k)) for q, qv in zip(questions, qvs)]
+
 # Add a test function to help debug
 def debug_kb_loading():
     """Test function to debug knowledge base loading."""
@@ -61,6 +61,14 @@ def stock_summary(tickers, period):
     
     return pd.DataFrame(results)
 
+def select_tickers(results, tickers):
+    """Pick the rows for `tickers` (in order) out of a shared stock_summary() frame."""
+    if results.empty:
+        return results
+    available = set(results["ticker"])
+    picked = [t for t in tickers if t in available]
+    return results.set_index("ticker").loc[picked].reset_index()
+
 def summarize_returns(results, period_label="1y"):
     if results.empty:
         return "No data available."
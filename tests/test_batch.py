@@ -0,0 +1,114 @@
+import json
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("yfinance")
+pytest.importorskip("matplotlib")
+
+from finassist import budget, cli, rag
+from finassist.data import tx
+
+QUESTIONS = [
+    "Where am I over budget in 2019-09?",
+    "Show me my top 3 categories for 2018-05",
+    "Show my spending categories",
+    "Compare AAPL and MSFT over 1y",
+    "Price of MSFT and NVDA 6m",
+    "How can I lower my internet bill?",
+    "What is the 50/30/20 rule?",
+    "hello",
+]
+
+class FakeModel:
+    """Deterministic, offline stand-in for SentenceTransformer (hashed bag of words)."""
+    def __init__(self, name):
+        pass
+
+    def encode(self, texts, normalize_embeddings=True, show_progress_bar=False):
+        out = np.zeros((len(texts), 64))
+        for row, text in zip(out, texts):
+            for w in re.findall(r"[a-z]{3,}", text.lower()):
+                row[sum(map(ord, w)) % 64] += 1
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return out / norms
+
+def fake_stock_summary(tickers, period):
+    return pd.DataFrame([
+        {"ticker": t, "return_pct": float(len(t)), "start": 100.0, "end": 100.0 + len(t), "last_close": 100.0 + len(t)}
+        for t in tickers
+    ])
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch, tmp_path):
+    monkeypatch.setattr(rag, "SentenceTransformer", FakeModel)
+    monkeypatch.setattr(rag, "EMB_PATH", str(tmp_path / "embeddings.pkl"))
+    monkeypatch.setattr(cli, "stock_summary", fake_stock_summary)
+
+def _answers(questions, processes=0):
+    results = list(cli.ask_batch(questions, processes=processes))
+    assert sorted(i for i, _, _, _ in results) == list(range(len(questions)))
+    assert [err for _, _, _, err in results if err] == []
+    return {i: answer for i, _, answer, _ in results}
+
+def test_read_questions_reports_bad_lines(tmp_path):
+    path = tmp_path / "questions.jsonl"
+    path.write_text("\n".join([
+        "5",
+        "[1]",
+        '{"id": "x"}',
+        '{"question": null}',
+        "{bad",
+        '"How can I lower my internet bill?"',
+        '{"id": "b", "question": "Where am I over budget in 2019-09?"}',
+    ]) + "\n\n", encoding="utf-8")
+    out = tmp_path / "answers.jsonl"
+
+    assert cli.run_batch(str(path), str(out)) == 2
+
+    recs = {r["lineno"]: r for r in map(json.loads, out.read_text(encoding="utf-8").splitlines())}
+    assert sorted(recs) == [1, 2, 3, 4, 5, 6, 7]
+    for lineno in (1, 2, 3, 4, 5):
+        assert recs[lineno]["error"] and recs[lineno]["answer"] is None
+    assert recs[3]["id"] == "x"
+    assert recs[6]["id"] == 6 and recs[6]["route"] == "advice" and "error" not in recs[6]
+    assert recs[7]["id"] == "b" and recs[7]["route"] == "budget" and "error" not in recs[7]
+
+def test_ask_batch_matches_ask():
+    answers = _answers(QUESTIONS)
+    for i, q in enumerate(QUESTIONS):
+        assert answers[i] == cli.ask(q)
+
+def _reference_month_report(month):
+    """The original single-month month_report() implementation."""
+    month_data = tx[tx["Month"] == month]
+    if month_data.empty:
+        return pd.DataFrame(columns=budget.BUDGET_COLUMNS)
+    actual = month_data.groupby("Category")["Spend"].sum().reset_index()
+    actual.columns = ["Category", "Actual"]
+    budget_data = pd.DataFrame([
+        {"Category": cat, "Budget": budget.BUDGET_DEFAULTS.get(cat, 100)} for cat in actual["Category"].unique()
+    ])
+    report = pd.merge(budget_data, actual, on="Category", how="outer")
+    report["Budget"] = report["Budget"].fillna(100)
+    report["Actual"] = report["Actual"].fillna(0)
+    report["Variance"] = report["Actual"] - report["Budget"]
+    return report[report["Actual"] > 0]
+
+def test_month_reports_match_month_report():
+    months = sorted(tx["Month"].unique()) + ["1999-01"]
+    reports = budget.month_reports(months)
+    assert list(reports) == months
+    for month in months:
+        expected = _reference_month_report(month).reset_index(drop=True)
+        pd.testing.assert_frame_equal(reports[month].reset_index(drop=True), expected, check_dtype=False)
+        pd.testing.assert_frame_equal(budget.month_report(month).reset_index(drop=True), expected, check_dtype=False)
+
+def test_ask_batch_process_pool_matches_inline():
+    # Enough RAG questions to span several slices, mixed with the other routes
+    questions = QUESTIONS + ["How can I lower my internet bill?", "How big should my emergency fund be?"] * 20
+    assert _answers(questions, processes=2) == _answers(questions, processes=0)